@@ -0,0 +1,28 @@
+"""
+Runs the dummy agents concurrently in a single process on one asyncio event loop.
+"""
+import asyncio
+
+from dummy_agents.stupid_agent import GameAgent, create_session, run as run_game_agent
+from dummy_agents.spinning_agent import SpinningAgent, run as run_spinning_agent
+
+
+async def run_agents():
+    """Run all agents until cancelled; GameAgent connections come from one shared pool."""
+    async with create_session() as session:
+        await asyncio.gather(
+            run_game_agent(GameAgent(session)),
+            run_spinning_agent(SpinningAgent())
+        )
+
+
+def main():
+    """Main function to run the agents."""
+    try:
+        asyncio.run(run_agents())
+    except KeyboardInterrupt:
+        print("\nStopping agents...")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,128 +1,298 @@
 """
 FastAPI routes for the space simulation game.
 """
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Body, FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
-from typing import Literal, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from physics_engine.game_state import GameState
+from urllib.parse import parse_qs
+import asyncio
+import math
 import time
-from collections import defaultdict
+import orjson
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 
 # Rate limiting configuration
 RATE_LIMIT = 5  # requests per second
 RATE_WINDOW = 1.0  # time window in seconds for rate limiting
+RATE_MAX_PLAYERS = 1024  # maximum number of tracked player counters
+RATE_IDLE_TIMEOUT = 60.0  # seconds before an idle player's counter is dropped
+RATE_EVICTION_INTERVAL = 10.0  # seconds between idle counter sweeps
 
-class MoveRequest(BaseModel):
-    player_id: str
-
-class RotateRequest(BaseModel):
-    player_id: str
-    direction: str  # "left" or "right"
+# Batch configuration
+MAX_BATCH_OPS = 8  # maximum number of operations in one batch request
 
-class FireRequest(BaseModel):
-    player_id: str
+# Pre-serialized error responses for the fixed error cases
+PLAYER_EXISTS = ORJSONResponse({"detail": "Player already exists"}, status_code=400)
+INVALID_MOVE = ORJSONResponse({"detail": "Invalid move"}, status_code=400)
+INVALID_ROTATION_DIRECTION = ORJSONResponse({"detail": "Invalid rotation direction"}, status_code=400)
+INVALID_ROTATION = ORJSONResponse({"detail": "Invalid rotation"}, status_code=400)
+CANNOT_FIRE = ORJSONResponse({"detail": "Cannot fire"}, status_code=400)
+CANNOT_ACTIVATE_SHIELD = ORJSONResponse({"detail": "Cannot activate shield"}, status_code=400)
+TOO_MANY_BATCH_OPS = ORJSONResponse(
+    {"detail": f"Too many operations. Maximum {MAX_BATCH_OPS} operations per batch."}, status_code=422
+)
 
-class ShieldRequest(BaseModel):
+class PlayerAction(BaseModel):
     player_id: str
 
-class RegisterRequest(BaseModel):
-    player_id: str
+class RegisterRequest(PlayerAction):
     name: Optional[str] = None
 
-def create_app(game_state: GameState) -> FastAPI:
-    """Create and configure the FastAPI application."""
-    app = FastAPI(title="Space Simulation API")
-    
-    # Rate limiting storage
-    request_timestamps = defaultdict(list)
-    
-    @app.middleware("http")
-    async def rate_limit_middleware(request: Request, call_next):
-        """Middleware to enforce rate limiting per player."""
+class BatchRequest(PlayerAction):
+    ops: List[Dict[str, Any]]  # e.g. [{"op": "move"}, {"op": "rotate", "direction": "left"}]
+
+class RateLimitASGI:
+    """Pure ASGI middleware to enforce rate limiting per player.
+
+    Uses a fixed-window counter per player: time is split into windows of
+    `window` seconds and at most `limit` requests are allowed in each window.
+    """
+
+    def __init__(self, app, state: "OrderedDict[str, Tuple[int, int]]", limit: int, window: float,
+                 max_players: int = RATE_MAX_PLAYERS):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The downstream ASGI application
+            state: Per-player counters as (window index, request count),
+                least recently used first
+            limit: Maximum number of requests per window
+            window: Time window in seconds
+            max_players: Maximum number of counters kept in `state`
+        """
+        self.app = app
+        self.state = state
+        self.limit = limit
+        self.window = window
+        self.max_players = max_players
+        self.retry_after = str(math.ceil(window)).encode()  # whole seconds, at most one window
+        self.rate_limited_body = orjson.dumps({
+            "detail": f"Rate limit exceeded. Maximum {limit} requests per second."
+        })
+
+    async def __call__(self, scope, receive, send):
+        """Handle a single ASGI connection."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get player_id from request
         player_id = None
-        if request.method == "GET":
-            player_id = request.query_params.get("player_id")
+        if scope["method"] == "GET":
+            query = parse_qs(scope["query_string"].decode("latin-1"))
+            player_id = query.get("player_id", [None])[0]
         else:
+            # Read the whole body once; the downstream app gets it replayed
+            # as a single message instead of reading and parsing it again
+            chunks = []
+            pending = []
+            more_body = True
+            while more_body:
+                message = await receive()
+                if message["type"] != "http.request":
+                    pending.append(message)  # e.g. http.disconnect
+                    break
+                chunks.append(message.get("body", b""))
+                more_body = message.get("more_body", False)
+            body = b"".join(chunks)
+
             try:
-                body = await request.json()
-                player_id = body.get("player_id")
-            except:
+                player_id = orjson.loads(body).get("player_id")
+            except (ValueError, AttributeError):
                 pass
-                
+
+            pending.insert(0, {"type": "http.request", "body": body, "more_body": False})
+            upstream_receive = receive
+
+            async def replay_receive():
+                """Replay the buffered body before reading new messages."""
+                if pending:
+                    return pending.pop(0)
+                return await upstream_receive()
+
+            receive = replay_receive
+
         if player_id:
-            # Clean old timestamps
-            current_time = time.time()
-            request_timestamps[player_id] = [
-                ts for ts in request_timestamps[player_id]
-                if current_time - ts < RATE_WINDOW
-            ]
-            
+            # Start a new count when the player enters a new window
+            window_index = int(time.monotonic() // self.window)
+            start, count = self.state.get(player_id, (window_index, 0))
+            if start != window_index:
+                start, count = window_index, 0
+
             # Check if rate limit exceeded
-            if len(request_timestamps[player_id]) >= RATE_LIMIT:
-                raise HTTPException(
-                    status_code=429,
-                    detail=f"Rate limit exceeded. Maximum {RATE_LIMIT} requests per second."
-                )
-                
-            # Add current timestamp
-            request_timestamps[player_id].append(current_time)
-            
-        # Get the response from the next middleware/route handler
-        response = await call_next(request)
-        return response
+            if count >= self.limit:
+                await self._send_rate_limited(send)
+                return
+
+            # Count this request and drop the least recently used counter if needed
+            self.state[player_id] = (start, count + 1)
+            self.state.move_to_end(player_id)
+            if len(self.state) > self.max_players:
+                self.state.popitem(last=False)
+
+        await self.app(scope, receive, send)
+
+    async def _send_rate_limited(self, send):
+        """Send a 429 response directly without going through the app."""
+        body = self.rate_limited_body
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", self.retry_after)
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+def create_app(game_state: GameState) -> FastAPI:
+    """Create and configure the FastAPI application."""
+    # Rate limiting storage
+    rate_counters: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+
+    async def evict_idle_counters():
+        """Periodically drop counters of players that stopped sending requests."""
+        while True:
+            await asyncio.sleep(RATE_EVICTION_INTERVAL)
+            current_time = time.monotonic()
+            # Counters are ordered by last use, so stop at the first active one
+            for player_id, (start, _) in list(rate_counters.items()):
+                # An expired window is reset on the next request anyway, so it can be recreated on demand
+                if current_time - start * RATE_WINDOW < RATE_IDLE_TIMEOUT:
+                    break
+                del rate_counters[player_id]
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Run the idle counter eviction task for the lifetime of the app."""
+        eviction_task = asyncio.create_task(evict_idle_counters())
+        try:
+            yield
+        finally:
+            eviction_task.cancel()
+            try:
+                await eviction_task
+            except asyncio.CancelledError:
+                pass
+
+    app = FastAPI(title="Space Simulation API", default_response_class=ORJSONResponse, lifespan=lifespan)
+    
+    # Compress larger responses; full game states repeat the same player keys
+    # and wall coordinates over and over, so they compress very well
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    # Rate limiting
+    app.add_middleware(
+        RateLimitASGI,
+        state=rate_counters,
+        limit=RATE_LIMIT,
+        window=RATE_WINDOW
+    )
 
     @app.post("/register")
-    async def register_player(request: RegisterRequest) -> Dict:
+    async def register_player(request: RegisterRequest) -> Response:
         """Register a new player."""
         if not game_state.add_player(request.player_id, request.name):
-            raise HTTPException(status_code=400, detail="Player already exists")
-        return game_state.get_state()
+            return PLAYER_EXISTS
+        return Response(content=game_state.cached_state_json(), media_type="application/json")
 
     @app.post("/unregister")
-    async def unregister_player(request: RegisterRequest) -> Dict:
+    async def unregister_player(request: PlayerAction) -> Dict:
         """Unregister a player."""
         game_state.remove_player(request.player_id)
         return {"success": True, "state": game_state.get_state()}
 
+    def conditional_json_response(request: Request, content: bytes, etag: str) -> Response:
+        """Build a JSON response, or 304 Not Modified if the client already has this version."""
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
     @app.get("/player_state")
-    async def get_player_state() -> Dict:
+    async def get_player_state() -> Response:
         """Get the current state of all players."""
-        return game_state.get_player_state()
+        return Response(content=game_state.cached_player_state_json(), media_type="application/json")
 
     @app.get("/environment_state") 
-    async def get_environment_state() -> Dict:
-        """Get the current state of the game environment."""
-        return game_state.get_environment_state()
+    async def get_environment_state(request: Request) -> Response:
+        """Get the current state of the game environment.
+        Answers 304 Not Modified if the client already has the current version."""
+        return conditional_json_response(request, *game_state.cached_environment_state_json())
+
+    @app.get("/full_state")
+    async def get_full_state(request: Request) -> Response:
+        """Get the player and environment state in a single request.
+        Answers 304 Not Modified if the client already has the current version."""
+        return conditional_json_response(request, *game_state.cached_full_state_json())
 
     @app.post("/move")
-    async def move_player(request: MoveRequest) -> Dict:
+    async def move_player(player_id: str = Body(..., embed=True)) -> Response:
         """Move a player in the specified direction."""
-        if not game_state.move_player(request.player_id):
-            raise HTTPException(status_code=400, detail="Invalid move")
-        return game_state.get_state()
+        if not game_state.move_player(player_id):
+            return INVALID_MOVE
+        return Response(content=game_state.cached_state_json(), media_type="application/json")
 
     @app.post("/rotate")
-    async def rotate_player(request: RotateRequest) -> Dict:
+    async def rotate_player(
+        player_id: str = Body(..., embed=True),
+        direction: str = Body(..., embed=True)  # "left" or "right"
+    ) -> Response:
         """Rotate a player in the specified direction."""
-        if request.direction not in ["left", "right"]:
-            raise HTTPException(status_code=400, detail="Invalid rotation direction")
-        if not game_state.rotate_player(request.player_id, request.direction):
-            raise HTTPException(status_code=400, detail="Invalid rotation")
-        return game_state.get_state()
+        if direction not in ["left", "right"]:
+            return INVALID_ROTATION_DIRECTION
+        if not game_state.rotate_player(player_id, direction):
+            return INVALID_ROTATION
+        return Response(content=game_state.cached_state_json(), media_type="application/json")
 
     @app.post("/fire")
-    async def fire_laser(request: FireRequest) -> Dict:
+    async def fire_laser(player_id: str = Body(..., embed=True)) -> Response:
         """Fire a laser from a player."""
-        if not game_state.fire_laser(request.player_id):
-            raise HTTPException(status_code=400, detail="Cannot fire")
-        return game_state.get_state()
+        if not game_state.fire_laser(player_id):
+            return CANNOT_FIRE
+        return Response(content=game_state.cached_state_json(), media_type="application/json")
 
     @app.post("/shield")
-    async def activate_shield(request: ShieldRequest) -> Dict:
+    async def activate_shield(player_id: str = Body(..., embed=True)) -> Response:
         """Activate shield for a player."""
-        if not game_state.activate_shield(request.player_id):
-            raise HTTPException(status_code=400, detail="Cannot activate shield")
-        return game_state.get_state()
+        if not game_state.activate_shield(player_id):
+            return CANNOT_ACTIVATE_SHIELD
+        return Response(content=game_state.cached_state_json(), media_type="application/json")
+
+    def run_batch_op(player_id: str, op: Dict[str, Any]) -> Dict:
+        """Run a single operation of a batch request and return its result."""
+        name = op.get("op")
+        if name == "player_state":
+            return game_state.get_player_state()
+        if name == "environment_state":
+            return game_state.get_environment_state()
+        if name == "full_state":
+            return game_state.get_full_state()
+        if name == "move":
+            return {"success": game_state.move_player(player_id)}
+        if name == "rotate":
+            direction = op.get("direction")
+            if direction not in ["left", "right"]:
+                return {"error": "Invalid rotation direction"}
+            return {"success": game_state.rotate_player(player_id, direction)}
+        if name == "fire":
+            return {"success": game_state.fire_laser(player_id)}
+        if name == "shield":
+            return {"success": game_state.activate_shield(player_id)}
+        return {"error": f"Unknown operation: {name}"}
+
+    @app.post("/batch")
+    async def run_batch(request: BatchRequest) -> List[Dict]:
+        """Run several operations for a player in one request.
+        Operations run in order without yielding to other requests.
+        A batch counts as one request against the rate limit, so its size is capped."""
+        if len(request.ops) > MAX_BATCH_OPS:
+            return TOO_MANY_BATCH_OPS
+        return [run_batch_op(request.player_id, op) for op in request.ops]
 
     return app 
\ No newline at end of file
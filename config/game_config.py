@@ -1,7 +1,10 @@
 """
 Game configuration module containing all constants and game settings.
 """
-from typing import List, Tuple
+from array import array
+from itertools import chain
+from typing import FrozenSet, List, Tuple
+import numpy as np
 
 # Screen dimensions
 SCREEN_WIDTH = 900
@@ -24,6 +27,8 @@ GRAY = (128, 128, 128)
 
 # Game settings
 FPS = 60
+PHYS_DT = 1 / 120  # seconds simulated per fixed physics step
+MAX_FRAME_TIME = 0.25  # seconds; longer stalls are not caught up on
 SHIELD_DURATION = 3.0  # seconds
 FLASH_DURATION = 0.5  # seconds
 INITIAL_LIFES = 5
@@ -32,6 +37,7 @@ INITIAL_LIFES = 5
 # Movement settings
 LASER_SPEED = 10.0  # blocks per second
 LASER_LENGTH = 0.5
+LASER_POOL_CAPACITY = 64  # initial laser slots, doubled when full
 
 # UI and rendering settings
 PLAYER_CIRCLE_RADIUS_FACTOR = 0.75  # Player circle radius as fraction of cell size
@@ -40,13 +46,15 @@ UI_CIRCLE_RADIUS = 10  # Radius of player identifier circles in UI
 TRANSPARENCY_ALPHA = 128  # Alpha value for semi-transparent elements (0-255)
 
 # Wall configuration
-# Generate border walls automatically based on screen dimensions
-BORDER_WALLS = (
-    [(x, 1) for x in range(GRID_WIDTH)] +  # Top wall
-    [(x, GRID_HEIGHT - 1) for x in range(GRID_WIDTH)] +  # Bottom wall
-    [(0, y) for y in range(GRID_HEIGHT)] +  # Left wall
-    [(GRID_WIDTH-1, y) for y in range(GRID_HEIGHT)]   # Right wall
-)
+# Generate border walls automatically based on screen dimensions,
+# stored flat as x0, y0, x1, y1, ...
+BORDER_WALLS_FLAT = array('H', chain.from_iterable(chain(
+    ((x, 1) for x in range(GRID_WIDTH)),  # Top wall
+    ((x, GRID_HEIGHT - 1) for x in range(GRID_WIDTH)),  # Bottom wall
+    ((0, y) for y in range(GRID_HEIGHT)),  # Left wall
+    ((GRID_WIDTH-1, y) for y in range(GRID_HEIGHT))   # Right wall
+)))
+BORDER_WALLS = list(zip(BORDER_WALLS_FLAT[0::2], BORDER_WALLS_FLAT[1::2]))
 
 
 # wold 1
@@ -146,8 +154,8 @@ OBSTACLE_WALLS4 = [
 
 
 
-# Combine border and obstacle walls
-WALLS: List[Tuple[int, int]] = BORDER_WALLS + OBSTACLE_WALLS2
+# Combine border and obstacle walls, dropping duplicates (e.g. border corners)
+WALLS: List[Tuple[int, int]] = list(dict.fromkeys(BORDER_WALLS + OBSTACLE_WALLS2))
 
 '''
 # Mine configuration with fixed positions
@@ -189,6 +197,25 @@ MINES = [
 ]
 '''
 
+# Lookup structures for collision checks, built once at import.
+# Cells are packed into a single int as y * GRID_WIDTH + x.
+def cell_key(x: int, y: int) -> int:
+    """Pack grid coordinates into a single int key."""
+    return y * GRID_WIDTH + x
+
+WALL_SET: FrozenSet[int] = frozenset(cell_key(x, y) for x, y in WALLS)
+
+# One byte per cell (1 = wall), indexed by cell_key
+WALL_BITMAP = bytes(1 if key in WALL_SET else 0 for key in range(GRID_WIDTH * GRID_HEIGHT))
+
+# Coordinates as an (N, 2) array for vectorized queries;
+# WALL_XY[:, 0] and WALL_XY[:, 1] are the x and y columns
+WALL_XY = np.array(WALLS, dtype=np.int16)
+
+# Boolean grid mask indexed as [x, y]
+WALL_MASK = np.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=bool)
+WALL_MASK[WALL_XY[:, 0], WALL_XY[:, 1]] = True
+
 # Player colors
 PLAYER_COLORS = {
     "player1": RED,
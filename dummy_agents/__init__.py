@@ -2,6 +2,8 @@
 Dummy agents package containing various AI agents for the space simulation game.
 """
 
-from .hunter_agent import HunterAgent
+from .stupid_agent import GameAgent
+from .spinning_agent import SpinningAgent
+from .rotating_agent import RotatingAgent
  
-__all__ = ['HunterAgent'] 
\ No newline at end of file
+__all__ = ['GameAgent', 'SpinningAgent', 'RotatingAgent']
\ No newline at end of file
@@ -3,10 +3,12 @@ Example of a slow-moving agent that moves in a single direction until hitting a
 then turns 90 degrees clockwise and continues moving.
 """
 import requests
+import orjson
 import time
 import signal
 import sys
 from typing import Optional
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 # Constants
@@ -15,6 +17,7 @@ RETRY_DELAY = 1  # seconds
 MOVE_DELAY = 0.5  # seconds between moves
 FIRE_DELAY = 2.0  # seconds between shots
 RATE_LIMIT_DELAY = 0.6  # seconds to wait after rate limit (slightly more than 0.5 to ensure we're under limit)
+REQUEST_TIMEOUT = 2  # seconds
 
 class RotatingAgent:
     def __init__(self, player_id: str = "player1"):
@@ -27,9 +30,14 @@ class RotatingAgent:
         self.last_move_time = 0
         self.last_request_time = 0  # Track last request time for rate limiting
         
+        # Reuse one keep-alive connection pool for all API calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        
     def _make_request(self, method: str, endpoint: str, json_data: dict = None, retry: bool = True) -> Optional[dict]:
         """Make an API request with rate limit handling and retries."""
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last_request = current_time - self.last_request_time
         
         # If less than 0.5 seconds since last request, wait
@@ -38,14 +46,12 @@ class RotatingAgent:
             
         for attempt in range(MAX_RETRIES):
             try:
-                if method == "GET":
-                    response = requests.get(f"{self.base_url}/{endpoint}")
-                else:
-                    response = requests.post(f"{self.base_url}/{endpoint}", json=json_data)
-                    
+                response = self.session.request(
+                    method, f"{self.base_url}/{endpoint}", json=json_data, timeout=REQUEST_TIMEOUT
+                )
                 response.raise_for_status()
-                self.last_request_time = time.time()
-                return response.json()
+                self.last_request_time = time.monotonic()
+                return orjson.loads(response.content)
                 
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 429 and retry:  # Rate limit exceeded
@@ -56,7 +62,7 @@ class RotatingAgent:
                 if attempt < MAX_RETRIES - 1:
                     time.sleep(RETRY_DELAY)
                 return None
-            except RequestException as e:
+            except (RequestException, orjson.JSONDecodeError) as e:
                 print(f"Request failed: {e}")
                 if attempt < MAX_RETRIES - 1:
                     time.sleep(RETRY_DELAY)
@@ -79,6 +85,7 @@ class RotatingAgent:
             self._make_request("POST", "unregister", {"player_id": self.player_id})
             self.registered = False
             print(f"Unregistered {self.name}")
+        self.session.close()
                 
     def get_state(self) -> Optional[dict]:
         """Get the current game state."""
@@ -100,7 +107,7 @@ class RotatingAgent:
             
     def move(self) -> bool:
         """Move the agent forward in its current direction."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_move_time < MOVE_DELAY:
             return False
             
@@ -117,7 +124,7 @@ class RotatingAgent:
             
     def fire(self) -> bool:
         """Fire a laser."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_fire_time < FIRE_DELAY:
             return False
             
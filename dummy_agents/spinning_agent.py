@@ -2,19 +2,25 @@
 Example of a slow-moving agent that moves in a single direction until hitting a wall,
 then turns 90 degrees clockwise and continues moving.
 """
-import requests
+import asyncio
+import httpx
+import orjson
+import random
 import time
-import signal
-import sys
 from typing import Optional
-from requests.exceptions import RequestException
 
 # Constants
 MAX_RETRIES = 3
-RETRY_DELAY = 1  # seconds
+BACKOFF_BASE = 0.2  # seconds, first retry waits up to this long
+BACKOFF_CAP = 8.0  # seconds, upper bound for a single retry wait
 MOVE_DELAY = 0.5  # seconds between moves
 FIRE_DELAY = 2.0  # seconds between shots
 RATE_LIMIT_DELAY = 0.6  # seconds to wait after rate limit (slightly more than 0.5 to ensure we're under limit)
+REQUEST_TIMEOUT = 2.0  # seconds
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
 
 class SpinningAgent:
     def __init__(self, player_id: str = "player1"):
@@ -26,151 +32,152 @@ class SpinningAgent:
         self.last_fire_time = 0
         self.last_move_time = 0
         self.last_request_time = 0  # Track last request time for rate limiting
-        
-    def _make_request(self, method: str, endpoint: str, json_data: dict = None, retry: bool = True) -> Optional[dict]:
+
+        # Reuse one keep-alive connection pool for all API calls
+        self.client = httpx.AsyncClient(base_url=self.base_url, timeout=REQUEST_TIMEOUT)
+
+    async def _make_request(self, method: str, endpoint: str, json_data: dict = None, retry: bool = True) -> Optional[dict]:
         """Make an API request with rate limit handling and retries."""
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last_request = current_time - self.last_request_time
-        
+
         # If less than 0.5 seconds since last request, wait
         if time_since_last_request < 0.5:
-            time.sleep(0.5 - time_since_last_request)
-            
+            await asyncio.sleep(0.5 - time_since_last_request)
+
         for attempt in range(MAX_RETRIES):
             try:
                 if method == "GET":
-                    response = requests.get(f"{self.base_url}/{endpoint}")
+                    response = await self.client.get(f"/{endpoint}")
                 else:
-                    response = requests.post(f"{self.base_url}/{endpoint}", json=json_data)
-                    
+                    response = await self.client.post(f"/{endpoint}", json=json_data)
+
                 response.raise_for_status()
-                self.last_request_time = time.time()
-                return response.json()
-                
-            except requests.exceptions.HTTPError as e:
+                self.last_request_time = time.monotonic()
+                return orjson.loads(response.content)
+
+            except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429 and retry:  # Rate limit exceeded
                     print(f"Rate limit exceeded, waiting {RATE_LIMIT_DELAY} seconds...")
-                    time.sleep(RATE_LIMIT_DELAY)
+                    await asyncio.sleep(RATE_LIMIT_DELAY)
                     continue
                 print(f"HTTP error: {e}")
+                # Client errors (e.g. an invalid move) will not succeed on retry
+                if e.response.status_code < 500:
+                    return None
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY)
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
                 return None
-            except RequestException as e:
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
                 print(f"Request failed: {e}")
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY)
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
                 return None
-                
+
         return None
-        
-    def register(self) -> bool:
+
+    async def register(self) -> bool:
         """Register the agent with the game server."""
-        response = self._make_request("POST", "register", {"player_id": self.player_id, "name": self.name})
+        response = await self._make_request("POST", "register", {"player_id": self.player_id, "name": self.name})
         if response:
             self.registered = True
             print(f"Successfully registered as {self.name}")
             return True
         return False
-        
-    def unregister(self):
+
+    async def unregister(self):
         """Unregister the agent from the game server."""
         if self.registered:
-            self._make_request("POST", "unregister", {"player_id": self.player_id})
+            await self._make_request("POST", "unregister", {"player_id": self.player_id})
             self.registered = False
             print(f"Unregistered {self.name}")
-                
-    def get_state(self) -> Optional[dict]:
+
+    async def close(self):
+        """Close the underlying HTTP connections."""
+        await self.client.aclose()
+
+    async def get_state(self) -> Optional[dict]:
         """Get the current game state."""
-        # Get player state
-        player_state = self._make_request("GET", "player_state")
-        if not player_state:
-            return None
-            
-        # Get environment state
-        env_state = self._make_request("GET", "environment_state")
-        if not env_state:
+        # Get player and environment state in one request
+        full_state = await self._make_request("GET", "full_state")
+        if not full_state:
             return None
-            
-        # Combine states
+
         return {
-            "players": player_state["players"],
-            "environment": env_state.get(self.player_id, {})
+            "players": full_state["players"],
+            "environment": full_state["environment"].get(self.player_id, {})
         }
-            
-    def move(self) -> bool:
+
+    async def move(self) -> bool:
         """Move the agent forward in its current direction."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_move_time < MOVE_DELAY:
             return False
-            
-        response = self._make_request("POST", "move", {"player_id": self.player_id})
+
+        response = await self._make_request("POST", "move", {"player_id": self.player_id})
         if response:
             self.last_move_time = current_time
             return True
         return False
-            
-    def rotate(self, direction: str) -> bool:
+
+    async def rotate(self, direction: str) -> bool:
         """Rotate the agent in the specified direction."""
-        response = self._make_request("POST", "rotate", {"player_id": self.player_id, "direction": direction})
+        response = await self._make_request("POST", "rotate", {"player_id": self.player_id, "direction": direction})
         return response is not None
-            
-    def fire(self) -> bool:
+
+    async def fire(self) -> bool:
         """Fire a laser."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_fire_time < FIRE_DELAY:
             return False
-            
-        response = self._make_request("POST", "fire", {"player_id": self.player_id})
+
+        response = await self._make_request("POST", "fire", {"player_id": self.player_id})
         if response:
             self.last_fire_time = current_time
             return True
         return False
-            
-    def activate_shield(self) -> bool:
+
+    async def activate_shield(self) -> bool:
         """Activate the shield."""
-        response = self._make_request("POST", "shield", {"player_id": self.player_id})
+        response = await self._make_request("POST", "shield", {"player_id": self.player_id})
         return response is not None
 
-def main():
-    """Main function to run the agent."""
-    # Create and register the agent
-    agent = SpinningAgent()
-    
-    # Set up signal handler for graceful shutdown
-    def signal_handler(sig, frame):
-        print("\nShutting down agent...")
-        agent.unregister()
-        sys.exit(0)
-        
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Register the agent
-    if not agent.register():
-        print("Failed to register agent. Exiting...")
-        return
-        
-    print("Agent registered successfully. Press Ctrl+C to exit.")
-    print("Moving in a single direction until hitting a wall, then turning 90 degrees clockwise.")
-    print("Firing laser every 2 seconds.")
-    
+async def run(agent: SpinningAgent):
+    """Register the agent and run its behavior loop until cancelled."""
     try:
+        # Register the agent
+        if not await agent.register():
+            print("Failed to register agent. Exiting...")
+            return
+
+        print("Agent registered successfully. Press Ctrl+C to exit.")
+        print("Moving in a single direction until hitting a wall, then turning 90 degrees clockwise.")
+        print("Firing laser every 2 seconds.")
+
         while True:
-            # Try to move forward
-            if not agent.move():
+            # Move forward and fire periodically at the same time
+            moved, _ = await asyncio.gather(agent.move(), agent.fire())
+            if not moved:
                 # If move failed (hit wall), rotate 90 degrees clockwise
-                agent.rotate("right")
-                
-            # Fire laser periodically
-            agent.fire()
-            
+                await agent.rotate("right")
+
             # Small delay to prevent overwhelming the server
-            time.sleep(0.1)
-            
+            await asyncio.sleep(0.1)
+
+    finally:
+        await agent.unregister()
+        await agent.close()
+
+def main():
+    """Main function to run the agent."""
+    # Create and run the agent; Ctrl+C cancels the loop and unregisters
+    agent = SpinningAgent()
+    try:
+        asyncio.run(run(agent))
     except KeyboardInterrupt:
         print("\nShutting down agent...")
-    finally:
-        agent.unregister()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,153 +1,229 @@
 """
 Example aggressive agent for the space simulation game API.
 """
-import requests
+import aiohttp
+import asyncio
+import orjson
+import random
 import time
 import json
 import math
-from requests.exceptions import RequestException
 from typing import Dict, List, Tuple, Optional
 import sys
 
 API_BASE_URL = "http://127.0.0.1:8000"
 MAX_RETRIES = 3
-RETRY_DELAY = 1  # seconds
+BACKOFF_BASE = 0.2  # seconds, first retry waits up to this long
+BACKOFF_CAP = 8.0  # seconds, upper bound for a single retry wait
 FIRE_INTERVAL = 2  # seconds
-RATE_LIMIT_DELAY = 0.6  # seconds to wait after rate limit (slightly more than 0.5 to ensure we're under limit)
+RATE_LIMIT_DELAY = 0.6  # seconds to wait after rate limit if the server sends no Retry-After
+REQUEST_RATE = 3.0  # requests per second refilled into the client-side token bucket
+REQUEST_BURST = 2.0  # bucket size; rate + burst stays within the server's 5 requests per second
+MIN_REQUEST_RATE = 0.5  # lower bound when backing off after rate limit errors
+RATE_INCREASE = 0.5  # requests per second added back after each successful request
 MOVE_DELAY = 0.1  # seconds between moves (reduced from 0.5 to make it faster than spinning agent)
+MAX_CONNECTIONS = 8  # size of the keep-alive connection pool
+KEEPALIVE_TIMEOUT = 60  # seconds to keep idle connections open
+STATE_CACHE_TTL = 0.5  # seconds to reuse a state response without asking the server
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+def create_session(base_url: str = API_BASE_URL) -> aiohttp.ClientSession:
+    """Create a keep-alive HTTP session that several agents can share. Must be called with a running event loop."""
+    return aiohttp.ClientSession(
+        base_url=base_url,
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+        connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS, keepalive_timeout=KEEPALIVE_TIMEOUT)
+    )
 
 class GameAgent:
     """Simple agent that follows walls and fires periodically."""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        """Initialize the agent."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None, base_url: str = API_BASE_URL):
+        """
+        Initialize the agent.
+        
+        Args:
+            session: Shared HTTP session to send requests on; if omitted the agent
+                creates and owns one, which requires a running event loop
+            base_url: Server URL used when the agent creates its own session
+        """
         self.base_url = base_url
         self.player_id = "stupid"
         self.name = "Stupid"  # Changed to "Stupid"
         self.last_move_time = 0
         self.last_fire_time = 0
         self.current_direction = "right"  # Start moving right
-        self.last_request_time = 0  # Track last request time for rate limiting
-        
-    def _make_request(self, method: str, endpoint: str, json_data: dict = None, retry: bool = True) -> Optional[dict]:
-        """Make an API request with rate limit handling and retries."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        # Client-side token bucket for rate limiting
+        self.rate = REQUEST_RATE
+        self.tokens = REQUEST_BURST
+        self.last_refill = time.monotonic()
+        self._state_cache: Dict[str, Tuple[Optional[str], float, Optional[Dict]]] = {}  # endpoint -> (ETag, fetch time, body)
+        self._owns_session = session is None
+        self.session = create_session(self.base_url) if session is None else session
         
-        # If less than 0.5 seconds since last request, wait
-        if time_since_last_request < 0.5:
-            time.sleep(0.5 - time_since_last_request)
+    async def _acquire_token(self):
+        """Wait until the token bucket allows another request."""
+        while True:
+            current_time = time.monotonic()
+            self.tokens = min(REQUEST_BURST, self.tokens + (current_time - self.last_refill) * self.rate)
+            self.last_refill = current_time
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
             
+    async def _make_request(self, method: str, endpoint: str, json_data: dict = None, retry: bool = True) -> Optional[dict]:
+        """Make an API request with rate limit handling and retries."""
         for attempt in range(MAX_RETRIES):
+            await self._acquire_token()
             try:
-                if method == "GET":
-                    response = requests.get(f"{self.base_url}/{endpoint}")
-                else:
-                    response = requests.post(f"{self.base_url}/{endpoint}", json=json_data)
-                    
-                response.raise_for_status()
-                self.last_request_time = time.time()
-                return response.json()
+                async with self.session.request(method, f"/{endpoint}", json=json_data) as response:
+                    response.raise_for_status()
+                    # Additive increase back towards the configured rate
+                    self.rate = min(REQUEST_RATE, self.rate + RATE_INCREASE)
+                    return orjson.loads(await response.read())
                 
-            except RequestException as e:
-                # Check if we have a response object and if it's a rate limit error
-                if hasattr(e, 'response') and e.response is not None and e.response.status_code == 429 and retry:
-                    print(f"Rate limit exceeded, waiting {RATE_LIMIT_DELAY} seconds...")
-                    time.sleep(RATE_LIMIT_DELAY)
+            except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+                # Check if it's a rate limit error
+                if isinstance(e, aiohttp.ClientResponseError) and e.status == 429 and retry:
+                    # Multiplicative decrease, then wait as long as the server asks
+                    self.rate = max(MIN_REQUEST_RATE, self.rate / 2)
+                    try:
+                        delay = float(e.headers.get("Retry-After", RATE_LIMIT_DELAY))
+                    except (AttributeError, ValueError):
+                        delay = RATE_LIMIT_DELAY
+                    print(f"Rate limit exceeded, waiting {delay} seconds...")
+                    await asyncio.sleep(delay)
                     continue
                 print(f"Request failed: {e}")
+                # Client errors (e.g. an invalid move) will not succeed on retry
+                if isinstance(e, aiohttp.ClientResponseError) and e.status < 500:
+                    return None
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY)
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
                 return None
                 
         return None
         
-    def register(self) -> bool:
+    async def close(self):
+        """Close the HTTP session if the agent created it."""
+        if self._owns_session:
+            await self.session.close()
+        
+    async def register(self) -> bool:
         """Register the agent with the game server."""
-        response = self._make_request("POST", "register", {"player_id": self.player_id, "name": self.name})
+        response = await self._make_request("POST", "register", {"player_id": self.player_id, "name": self.name})
         if response:
             print(f"Registered with ID: {self.player_id}")
             return True
         return False
             
-    def unregister(self) -> bool:
+    async def unregister(self) -> bool:
         """Unregister the agent from the game server."""
         if not self.player_id:
             return True
             
-        response = self._make_request("POST", "unregister", {"player_id": self.player_id})
+        response = await self._make_request("POST", "unregister", {"player_id": self.player_id})
         if response:
             print("Unregistered successfully")
             return True
         return False
             
-    def get_state(self) -> Optional[Dict]:
-        """Get the current game state."""
-        # Get player state
-        player_state = self._make_request("GET", "player_state")
-        if not player_state:
+    async def _get_cached(self, endpoint: str) -> Optional[Dict]:
+        """GET a state endpoint, reusing the cached copy while it is fresh or unchanged."""
+        etag, fetched_at, body = self._state_cache.get(endpoint, (None, 0.0, None))
+        current_time = time.monotonic()
+        if body is not None and current_time - fetched_at < STATE_CACHE_TTL:
+            return body
+            
+        await self._acquire_token()
+        headers = {"If-None-Match": etag} if etag else None
+        try:
+            async with self.session.get(f"/{endpoint}", headers=headers) as response:
+                if response.status == 304:  # Not modified, keep the cached copy
+                    self._state_cache[endpoint] = (etag, current_time, body)
+                    return body
+                response.raise_for_status()
+                body = orjson.loads(await response.read())
+                self._state_cache[endpoint] = (response.headers.get("ETag"), current_time, body)
+                return body
+        except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+            print(f"Request failed: {e}")
             return None
             
-        # Get environment state
-        env_state = self._make_request("GET", "environment_state")
-        if not env_state:
+    async def get_state(self) -> Optional[Dict]:
+        """Get the current game state."""
+        # Get player and environment state in one request
+        full_state = await self._get_cached("full_state")
+        if not full_state:
             return None
             
-        # Combine states
         return {
-            "players": player_state["players"],
-            "environment": env_state.get(self.player_id, {})
+            "players": full_state["players"],
+            "environment": full_state["environment"].get(self.player_id, {})
         }
             
-    def move(self, direction: str) -> bool:
+    async def move(self, direction: str) -> bool:
         """Move the agent in the specified direction."""
         if not self.player_id:
             return False
             
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_move_time < MOVE_DELAY:
             return False
             
-        response = self._make_request("POST", "move", {"player_id": self.player_id, "direction": direction})
+        response = await self._make_request("POST", "move", {"player_id": self.player_id, "direction": direction})
         if response:
             self.last_move_time = current_time
             return True
         return False
             
-    def rotate(self, direction: str) -> bool:
+    async def rotate(self, direction: str) -> bool:
         """Rotate the agent by the specified direction."""
         if not self.player_id:
             return False
             
-        response = self._make_request("POST", "rotate", {"player_id": self.player_id, "direction": direction})
+        response = await self._make_request("POST", "rotate", {"player_id": self.player_id, "direction": direction})
         return response is not None
             
-    def fire(self) -> bool:
+    async def fire(self) -> bool:
         """Fire a laser."""
         if not self.player_id:
             return False
             
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_fire_time < FIRE_INTERVAL:
             return False
             
-        response = self._make_request("POST", "fire", {"player_id": self.player_id})
+        response = await self._make_request("POST", "fire", {"player_id": self.player_id})
         if response:
             self.last_fire_time = current_time
             return True
         return False
             
-    def step(self) -> bool:
+    async def step(self) -> bool:
         """Execute one step of the agent's behavior."""
-        # Check if we need to fire
-        current_time = time.time()
-        if current_time - self.last_fire_time >= FIRE_INTERVAL:
-            self.fire()
+        # Move in current direction and, if the interval has passed, fire in one request
+        current_time = time.monotonic()
+        ops = [{"op": "move", "direction": self.current_direction}]
+        fire = current_time - self.last_fire_time >= FIRE_INTERVAL
+        if fire:
+            ops.append({"op": "fire"})
+            
+        results = await self._make_request("POST", "batch", {"player_id": self.player_id, "ops": ops})
+        moved = bool(results) and results[0].get("success", False)
+        if moved:
+            self.last_move_time = current_time
+        if fire and results and results[1].get("success", False):
+            self.last_fire_time = current_time
             
-        # Try to move in current direction
-        if not self.move(self.current_direction):
+        if not moved:
             # If move failed (hit wall), rotate 90 degrees clockwise
-            self.rotate("right")
+            await self.rotate("right")
             # Update direction based on new rotation
             if self.current_direction == "right":
                 self.current_direction = "down"
@@ -160,34 +236,45 @@ class GameAgent:
                 
         return True
 
-def main():
-    """Main function to run the agent."""
-    agent = GameAgent()
-    
-    # Register with retries
-    for attempt in range(MAX_RETRIES):
-        print(f"Attempting to register (attempt {attempt + 1}/{MAX_RETRIES})...")
-        if agent.register():
-            break
-        if attempt < MAX_RETRIES - 1:
-            time.sleep(RETRY_DELAY)
-    else:
-        print("Failed to register after maximum retries")
-        return
-        
+async def run(agent: GameAgent):
+    """Register the agent and run it until cancelled."""
     try:
-        print("Agent started. Press Ctrl+C to quit.")
-        while True:
-            if not agent.step():
-                print("Step failed, stopping agent")
+        # Register with retries
+        for attempt in range(MAX_RETRIES):
+            print(f"Attempting to register (attempt {attempt + 1}/{MAX_RETRIES})...")
+            if await agent.register():
                 break
-                
-            time.sleep(0.1)  # Small delay to prevent overwhelming the server
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+        else:
+            print("Failed to register after maximum retries")
+            return
             
+        try:
+            print("Agent started. Press Ctrl+C to quit.")
+            while True:
+                if not await agent.step():
+                    print("Step failed, stopping agent")
+                    break
+                    
+                await asyncio.sleep(0.1)  # Small delay to prevent overwhelming the server
+                
+        finally:
+            await agent.unregister()
+    finally:
+        await agent.close()
+
+async def run_standalone():
+    """Run a single agent on its own session."""
+    async with create_session() as session:
+        await run(GameAgent(session))
+
+def main():
+    """Main function to run the agent."""
+    try:
+        asyncio.run(run_standalone())
     except KeyboardInterrupt:
         print("\nStopping agent...")
-    finally:
-        agent.unregister()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
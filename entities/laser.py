@@ -2,31 +2,69 @@
 Laser module for handling laser behavior and properties.
 """
 import pygame
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 from physics_engine.position import Position
 from config.game_config import CELL_SIZE, LASER_SPEED, LASER_LENGTH, RED
 
+if TYPE_CHECKING:
+    from physics_engine.laser_pool import LaserPool
+
 class Laser:
-    """Represents a laser projectile in the game."""
+    """Represents a laser projectile in the game.
+    The laser's position and active flag live in a LaserPool slot; this object is a view on it."""
     
-    def __init__(self, position: Position, direction: Position, cell_size: int, owner_id: str):
+    def __init__(self, pool: 'LaserPool', slot: int, direction: Position, cell_size: int, owner_id: str):
         """
-        Initialize a new laser.
+        Initialize a new laser view.
         
         Args:
-            position: Initial position of the laser
+            pool: LaserPool holding the laser's position and active flag
+            slot: Index of the laser in the pool
             direction: Direction vector of the laser
             cell_size: Size of a cell in pixels
             owner_id: ID of the entity that fired the laser
         """
-        self.position = Position(position.x, position.y)
+        self._pool = pool
+        self.slot = slot
         self.direction = direction
         self.cell_size = cell_size
+        self._half = cell_size // 2  # Offset from cell corner to cell center
         self.owner_id = owner_id
-        self.active = True
         self.speed = LASER_SPEED  # Using config value
         self.length = LASER_LENGTH  # Using config value
         
+    @property
+    def pos_x(self) -> float:
+        """Current x coordinate of the laser."""
+        return float(self._pool.pos[self.slot, 0])
+        
+    @pos_x.setter
+    def pos_x(self, value: float):
+        self._pool.pos[self.slot, 0] = value
+        
+    @property
+    def pos_y(self) -> float:
+        """Current y coordinate of the laser."""
+        return float(self._pool.pos[self.slot, 1])
+        
+    @pos_y.setter
+    def pos_y(self, value: float):
+        self._pool.pos[self.slot, 1] = value
+        
+    @property
+    def position(self) -> Position:
+        """Current position of the laser."""
+        return Position(self.pos_x, self.pos_y)
+        
+    @property
+    def active(self) -> bool:
+        """Whether the laser is still in flight."""
+        return bool(self._pool.active[self.slot])
+        
+    @active.setter
+    def active(self, value: bool):
+        self._pool.active[self.slot] = value
+        
     def update(self, dt: float):
         """
         Update laser position based on direction and time.
@@ -38,8 +76,8 @@ class Laser:
             return
             
         # Move laser in its direction using configured speed
-        self.position.x += self.direction.x * dt * self.speed
-        self.position.y += self.direction.y * dt * self.speed
+        self.pos_x += self.direction.x * dt * self.speed
+        self.pos_y += self.direction.y * dt * self.speed
         
     def render(self, screen: pygame.Surface):
         """
@@ -51,13 +89,9 @@ class Laser:
         if not self.active:
             return
             
-        # Draw laser as a red line
-        start_pos = (
-            int(self.position.x * self.cell_size + self.cell_size/2),
-            int(self.position.y * self.cell_size + self.cell_size/2)
-        )
-        end_pos = (
-            int((self.position.x + self.direction.x) * self.cell_size + self.cell_size/2),
-            int((self.position.y + self.direction.y) * self.cell_size + self.cell_size/2)
-        )
-        pygame.draw.line(screen, RED, start_pos, end_pos, 2) 
\ No newline at end of file
+        # Draw laser as a red line one cell long, starting at the cell center
+        sx = int(self.pos_x * self.cell_size) + self._half
+        sy = int(self.pos_y * self.cell_size) + self._half
+        ex = sx + int(self.direction.x * self.cell_size)
+        ey = sy + int(self.direction.y * self.cell_size)
+        pygame.draw.line(screen, RED, (sx, sy), (ex, ey), 2)
\ No newline at end of file
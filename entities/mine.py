@@ -2,20 +2,26 @@
 Mine module containing the Mine class.
 """
 import pygame
+from typing import Dict
 from physics_engine.position import Position
 
 class Mine:
     """Represents a mine that can damage spaceships."""
     
+    # Scaled mine images shared by all mines, keyed by cell size
+    _IMAGE_CACHE: Dict[int, pygame.Surface] = {}
+    
     def __init__(self, position: Position, cell_size: int):
         """Initialize the mine with position."""
         self.position = position
         self.cell_size = cell_size
         self.active = True
-        # Load mine image
-        self.image = pygame.image.load('assets/mine.png')
-        # Scale image to cell size
-        self.image = pygame.transform.scale(self.image, (cell_size, cell_size))
+        # Load and scale the mine image only once per cell size
+        image = Mine._IMAGE_CACHE.get(cell_size)
+        if image is None:
+            image = pygame.transform.scale(pygame.image.load('assets/mine.png'), (cell_size, cell_size))
+            Mine._IMAGE_CACHE[cell_size] = image
+        self.image = image
         
     def render(self, screen: pygame.Surface):
         """Render the mine if it's active"""
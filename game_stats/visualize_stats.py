@@ -1,26 +1,29 @@
 """
 Script to visualize game statistics from CSV files.
 """
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Render straight to file, no GUI backend needed
 import matplotlib.pyplot as plt
 import os
 from datetime import datetime
 import glob
 
+# Scoring system: points = (stat // divisor) * weight for each stat column
+SCORE_STATS = ['seconds_survived', 'laser_hits', 'lives_lost', 'is_last_surviving']
+SCORE_CATEGORIES = ['survival_points', 'laser_hit_points', 'life_lost_penalty', 'last_survivor_bonus']
+SCORE_DIVISORS = np.array([3, 1, 1, 1])  # +1 point per 3 seconds survived
+SCORE_WEIGHTS = np.array([1, 5, -5, 25])  # +5 per laser hit, -5 per life lost, +25 if last surviving
+
+def calculate_points(df):
+    """Calculate the points per scoring category as an (n_rows, 4) array."""
+    stats = df[SCORE_STATS].to_numpy(dtype=np.int64)
+    return stats // SCORE_DIVISORS * SCORE_WEIGHTS
+
 def calculate_scores(df):
     """Calculate scores for each player based on the scoring system."""
-    # Calculate points for each category
-    df['survival_points'] = (df['seconds_survived'])//3 * 1  # +1 point per 3 seconds
-    df['laser_hit_points'] = df['laser_hits'] * 5  # +5 points per laser hit
-    df['life_lost_penalty'] = df['lives_lost'] * -5  # -5 points per life lost
-    df['last_survivor_bonus'] = df['is_last_surviving'].astype(int) * 25  # +25 points if last surviving
-    
-    # Calculate total score
-    df['total_score'] = (df['survival_points'] + 
-                        df['laser_hit_points'] + 
-                        df['life_lost_penalty'] + 
-                        df['last_survivor_bonus'])
-    
+    df['total_score'] = calculate_points(df).sum(axis=1)
     return df
 
 def create_visualization(df, timestamp):
@@ -40,11 +43,12 @@ def create_visualization(df, timestamp):
     ax1.grid(True, axis='x', linestyle='--', alpha=0.7)
     
     # Plot 2: Score Breakdown (Grouped Bar Chart)
-    categories = ['survival_points', 'laser_hit_points', 'life_lost_penalty', 'last_survivor_bonus']
+    categories = SCORE_CATEGORIES
     category_labels = ['Survival', 'Laser Hits', 'Life Lost', 'Last Survivor']
     
     # Calculate category totals for each player
-    category_totals = df.groupby('player_id')[categories].sum()
+    points = pd.DataFrame(calculate_points(df), columns=categories, index=df['player_id'])
+    category_totals = points.groupby(level=0).sum()
     
     # Set up the grouped bar chart
     x = range(len(player_scores.index))
@@ -64,10 +68,10 @@ def create_visualization(df, timestamp):
     ax2.grid(True, axis='y', linestyle='--', alpha=0.7)
     
     # Adjust layout and save
-    plt.tight_layout()
+    fig.tight_layout()
     output_filename = os.path.join('game_stats', f"{timestamp}_stats.png")
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig(output_filename, dpi=150)
+    plt.close(fig)
     
     print(f"Visualization saved as: {output_filename}")
 
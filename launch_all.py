@@ -1,24 +1,40 @@
 import subprocess
 import time
+import urllib.request
+from urllib.error import URLError
 
+SERVER_URL = "http://127.0.0.1:8000/player_state"
+READY_TIMEOUT = 30  # seconds
+READY_POLL_INTERVAL = 0.1  # seconds
 
-# Command 2 & 3: Start agents and game in parallel
+
+def wait_for_server():
+    """Poll the API until it answers, instead of sleeping a fixed time."""
+    deadline = time.monotonic() + READY_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(SERVER_URL, timeout=1):
+                return True
+        except (URLError, OSError):
+            time.sleep(READY_POLL_INTERVAL)
+    return False
+
+
+# Command 1 & 2: Start the game, then all agents together in one process
 cmd1 = ["python3", "main.py"]
 p1 = subprocess.Popen(cmd1)
-time.sleep(2)
-cmd2 = ["python3", "dummy_agents/stupid_agent.py"]
-cmd3 = ["python3", "dummy_agents/spinning_agent.py"]
+if not wait_for_server():
+    print("Server failed to start within the timeout period")
+cmd2 = ["python3", "agents_runner.py"]
 
 p2 = subprocess.Popen(cmd2)
-p3 = subprocess.Popen(cmd3)
 
 # Optional: Wait for all to complete (CTRL+C will interrupt)
 try:
     p1.wait()
     p2.wait()
-    p3.wait()
 except KeyboardInterrupt:
     print("\nStopping all processes...")
-    for p in [p1, p2, p3]:
+    for p in [p1, p2]:
         p.terminate()
 
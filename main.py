@@ -9,14 +9,13 @@ import os
 import sys
 from threading import Thread, Event
 import time
-import requests
 
 # Add the project root directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from physics_engine.game_state import GameState
 from visualization.renderer import GameRenderer
-from config.game_config import FPS
+from config.game_config import FPS, PHYS_DT, MAX_FRAME_TIME
 from api.routes import create_app
 
 class Game:
@@ -41,14 +40,20 @@ class Game:
     def run(self):
         """Main game loop."""
         try:
+            accumulator = 0.0
+            last = time.perf_counter()
             while self.running:
-                # Calculate delta time
-                current_time = time.time()
-                dt = current_time - self.game_state.last_time
-                self.game_state.last_time = current_time
+                # Calculate frame time, capped so a long stall does not trigger a burst of steps
+                now = time.perf_counter()
+                accumulator += min(now - last, MAX_FRAME_TIME)
+                last = now
                 
+                # Advance physics in fixed steps, independent of the render rate
+                while accumulator >= PHYS_DT:
+                    self.game_state.update(PHYS_DT)
+                    accumulator -= PHYS_DT
+                    
                 self.handle_events()
-                self.game_state.update(dt)
                 self.renderer.render()
                 self.clock.tick(FPS)
         except Exception as e:
@@ -56,32 +61,33 @@ class Game:
         finally:
             pygame.quit()
 
+class ReadyServer(uvicorn.Server):
+    """Uvicorn server that sets an event once it is listening for connections."""
+
+    def __init__(self, config: uvicorn.Config, ready_event: Event):
+        super().__init__(config)
+        self.ready_event = ready_event
+
+    async def startup(self, sockets=None):
+        """Start the server and signal readiness once the socket is bound."""
+        await super().startup(sockets=sockets)
+        if self.started:
+            self.ready_event.set()
+
 def run_api(game_instance):
     """Run the FastAPI server."""
     try:
         app = create_app(game_instance.game_state)
-        uvicorn.run(app, host="127.0.0.1", port=8000)
+        config = uvicorn.Config(
+            app, host="127.0.0.1", port=8000,
+            loop="auto", http="httptools",  # uvloop when installed
+            timeout_keep_alive=75,  # keep agent connections open between requests
+            log_level="warning", access_log=False  # no per-request log line
+        )
+        ReadyServer(config, game_instance.server_ready).run()
     except Exception as e:
         print(f"Error in API server: {e}")
 
-def wait_for_server():
-    """Wait for the server to be ready."""
-    max_retries = 30  # 30 seconds maximum wait time
-    retry_interval = 1  # Check every second
-    
-    for _ in range(max_retries):
-        try:
-            response = requests.get("http://127.0.0.1:8000/player_state")
-            if response.status_code == 200:
-                print("Server is ready!")
-                return True
-        except requests.exceptions.ConnectionError:
-            time.sleep(retry_interval)
-            continue
-    
-    print("Server failed to start within the timeout period")
-    return False
-
 if __name__ == "__main__":
     game = Game()
     
@@ -89,10 +95,12 @@ if __name__ == "__main__":
     api_thread = Thread(target=run_api, args=(game,), daemon=True)
     api_thread.start()
     
-    # Wait for server to be ready
-    if not wait_for_server():
+    # Wait for server to be ready (30 seconds maximum wait time)
+    if not game.server_ready.wait(timeout=30):
+        print("Server failed to start within the timeout period")
         print("Exiting due to server initialization failure")
         sys.exit(1)
+    print("Server is ready!")
     
     # Run game loop
     game.run() 
\ No newline at end of file
@@ -1,28 +1,38 @@
 """
 Game state module for managing the game state and logic.
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import time
-import math
 import sys
+import hashlib
+import numpy as np
+import orjson
 from physics_engine.position import Position
 from physics_engine.physics import PhysicsEngine
+from physics_engine.laser_pool import LaserPool
 from physics_engine.player_stats import GameStats
 from config.game_config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, CELL_SIZE,
     SHIELD_DURATION, INITIAL_LIFES, LASER_SPEED,
-    WALLS, MINES, FLASH_DURATION, GRID_WIDTH, GRID_HEIGHT
+    WALLS, MINES, FLASH_DURATION, GRID_WIDTH, GRID_HEIGHT,
+    WALL_BITMAP, WALL_XY, WALL_MASK
 )
 from entities.spaceship import Spaceship
 from entities.laser import Laser
 from entities.mine import Mine
 
+VIEW_RADIUS = 5  # Grid cells visible around a player in the environment state
+
+def _relative_within(points: np.ndarray, x: float, y: float) -> List[List[float]]:
+    """Offsets of an (N, 2) array of points from (x, y), keeping those within VIEW_RADIUS."""
+    offsets = points - np.array([x, y], dtype=points.dtype)
+    return offsets[np.abs(offsets).max(axis=1) <= VIEW_RADIUS].tolist()
+
 class GameState:
     """Manages the game state and logic."""
     
     def __init__(self):
         """Initialize game state."""
-        self.last_time = time.time()
         self.physics_engine = PhysicsEngine(SCREEN_WIDTH, SCREEN_HEIGHT, CELL_SIZE)
         self.players: Dict[str, Spaceship] = {}
         self.is_flashing = False
@@ -33,21 +43,31 @@ class GameState:
         self.GAME_TIME_LIMIT = 120.0  # 2 minutes time limit
         self.game_over_time = None  # Track when game over was triggered
         self.SHUTDOWN_DELAY = 2.0  # 2 seconds delay before shutdown
+        self._state_version = 0  # Bumped whenever the game state changes
+        self._json_cache: Dict[str, Tuple[int, bytes, str]] = {}  # name -> (version, JSON, ETag)
         self.reset()
         
     def reset(self):
         """Reset game state to initial values."""
-        self.last_time = time.time()
         self.game_over = False
-        self.lasers: List[Laser] = []
+        self.lasers = LaserPool()
         self.mines = [Mine(Position(x, y), CELL_SIZE) for x, y in MINES]
+        self._mine_cells: Dict[Tuple[int, int], List[Mine]] = {}  # grid cell -> mines in it, rebuilt each update
         self.walls = [Position(x, y) for x, y in WALLS]
+        self.walls_bitmap = WALL_BITMAP  # One byte per cell (1 = wall) for collision lookups
+        self._walls_np = WALL_XY.astype(np.int32)  # (W, 2) wall coordinates
+        self._walls_rel_cache: Dict[Tuple[int, int], List[List[int]]] = {}  # player cell -> visible wall offsets
+        self._wall_mask = WALL_MASK  # Wall cells indexed [x, y] for vectorized laser checks
+        # (mine list, (M, 2) coordinates of those mines), rebuilt once self.mines is replaced
+        self._mines_np: Optional[Tuple[List[Mine], np.ndarray]] = None
         self.players.clear()
+        self._player_cells: Dict[Tuple[int, int], Set[str]] = {}  # grid cell -> IDs of the players in it
         self.is_flashing = False
         self.flash_start_time = 0
         self.stats = GameStats()  # Reset statistics
         self.game_start_time = None  # Reset game start time
         self.game_over_time = None  # Reset game over time
+        self._state_version += 1
         
     def add_player(self, player_id: str, name: str = None) -> bool:
         """Add a new player to the game."""
@@ -70,8 +90,8 @@ class GameState:
         spawn_pos = None
         for pos in spawn_positions:
             # Check if position is valid and not occupied
-            if (self.physics_engine.is_valid_move(Position(pos[0], pos[1]), self.walls) and
-                not any(p.position.x == pos[0] and p.position.y == pos[1] for p in self.players.values())):
+            if (self.physics_engine.is_open_cell(pos[0], pos[1], self.walls_bitmap) and
+                not self._player_cells.get(pos)):
                 spawn_pos = pos
                 break
         
@@ -92,67 +112,67 @@ class GameState:
             player.name = f"Player {player_count}"
             
         self.players[player_id] = player
+        self._player_cells.setdefault(spawn_pos, set()).add(player_id)
         self.stats.add_player(player_id)  # Add player to statistics tracking
         
         # Set game start time when first player joins
         if self.game_start_time is None:
-            self.game_start_time = time.time()
+            self.game_start_time = time.monotonic()
             
+        self._state_version += 1
         return True
         
     def remove_player(self, player_id: str) -> bool:
         """Remove a player from the game."""
         if player_id not in self.players:
             return False
-        del self.players[player_id]
+        player = self.players.pop(player_id)
+        self._vacate_cell(player.position, player_id)
+        self._state_version += 1
         return True
         
     def update(self, dt: float):
         """Update game state."""
+        # Read the clock once per update
+        current_time = time.monotonic()
+        
         if self.game_over:
             # Check if it's time to shut down
-            if self.game_over_time is not None and time.time() - self.game_over_time >= self.SHUTDOWN_DELAY:
+            if self.game_over_time is not None and current_time - self.game_over_time >= self.SHUTDOWN_DELAY:
                 print("Shutting down game...")
                 sys.exit(0)  # Exit the program
             return
             
-        # Update lasers
-        for laser in self.lasers[:]:
-            if not laser.active:
-                self.lasers.remove(laser)
-                continue
-                
-            # Update laser position
-            if not self.physics_engine.update_laser_position(laser, dt):
-                laser.active = False
-                continue
-                
-            # Check for collisions
-            if self.physics_engine.check_wall_collision(laser.position, self.walls):
-                laser.active = False
-                continue
-                
-            # Check for mine collisions
-            for mine in self.mines[:]:
-                if self.physics_engine.check_mine_collision(laser.position, mine.position):
-                    self.mines.remove(mine)
-                    laser.active = False
-                    break
+        self._state_version += 1
+        self._index_mines()
+        
+        with self.lasers.lock:
+            # Free the slots of lasers that stopped last tick, then advance the rest,
+            # deactivating those that leave the world or hit a wall
+            self.lasers.release_inactive()
+            self.physics_engine.update_lasers(self.lasers, dt, self._wall_mask)
+            
+            # Check for mine collisions in each remaining laser's cell
+            slots = self.lasers.active_slots()
+            for slot, cell in zip(slots.tolist(), self.lasers.cells(slots)):
+                cell_mines = self._mine_cells.get(cell)
+                if cell_mines:
+                    cell_mines.pop(0).active = False
+                    self.lasers.active[slot] = False
                     
         # Update players and their statistics
         active_players = 0
         last_active_player = None
         for player in self.players.values():
-            if player.shield_active and time.time() - player.shield_start_time > SHIELD_DURATION:
+            if player.shield_active and current_time - player.shield_start_time > SHIELD_DURATION:
                 player.shield_active = False
             if player.active:
                 active_players += 1
                 last_active_player = player
-            self.stats.update_stats(player.id, player.active)
+            self.stats.update_stats(player.id, player.active, current_time)
         
         # Check if game is over (only one player left, no players, or time limit reached)
         # Only check after the game start delay has passed
-        current_time = time.time()
         if (self.game_start_time is not None and 
             current_time - self.game_start_time >= self.GAME_START_DELAY and
             len(self.players) > 0):
@@ -174,36 +194,62 @@ class GameState:
                     print("Time limit of 2 minutes reached!")
         
         # Update flash effect
-        if self.is_flashing and time.time() - self.flash_start_time > FLASH_DURATION:
+        if self.is_flashing and current_time - self.flash_start_time > FLASH_DURATION:
             self.is_flashing = False
         
-        # Check player collisions
-        self._check_collisions()
+        # Check player collisions; lasers that hit are deactivated in the pool
+        with self.lasers.lock:
+            self._check_collisions(current_time)
         
-    def _check_collisions(self):
-        """Check for collisions between players and other objects."""
+        # Sweep out the mines destroyed this tick in one pass
+        live_mines = [mine for mine in self.mines if mine.active]
+        if len(live_mines) != len(self.mines):
+            self.mines = live_mines
+            self._mines_np = None
+        
+    def _vacate_cell(self, cell: Tuple[int, int], player_id: str):
+        """Remove a player from the cell index, dropping the cell once it is empty."""
+        occupants = self._player_cells.get(cell)
+        if occupants is not None:
+            occupants.discard(player_id)
+            if not occupants:
+                del self._player_cells[cell]
+            
+    def _index_mines(self):
+        """Group the mines by the grid cell they occupy."""
+        self._mine_cells = {}
+        for mine in self.mines:
+            self._mine_cells.setdefault((int(mine.position.x), int(mine.position.y)), []).append(mine)
+            
+    def _check_collisions(self, current_time: float):
+        """Check for collisions between players and other objects at the given time."""
+        # Group the active lasers by grid cell so each player only checks its own cell
+        laser_cells: Dict[Tuple[int, int], List[Laser]] = {}
+        slots = self.lasers.active_slots()
+        for slot, cell in zip(slots.tolist(), self.lasers.cells(slots)):
+            laser_cells.setdefault(cell, []).append(self.lasers.views[slot])
+                
         for player in self.players.values():
             if not player.active:
                 continue
                 
+            cell = (int(player.position.x), int(player.position.y))
+            
             # Check mine collisions
-            for mine in self.mines[:]:
-                if self.physics_engine.check_mine_collision(player.position, mine.position):
-                    if not player.shield_active:
-                        player.lifes -= 3  # Lose 3 lifes when hitting a mine
-                        self.stats.record_life_lost(player.id)  # Record life lost
-                        if player.lifes <= 0:
-                            player.active = False
-                        self.is_flashing = True
-                        self.flash_start_time = time.time()
-                    self.mines.remove(mine)
-                    break
+            cell_mines = self._mine_cells.get(cell)
+            if cell_mines:
+                if not player.shield_active:
+                    player.lifes -= 3  # Lose 3 lifes when hitting a mine
+                    self.stats.record_life_lost(player.id)  # Record life lost
+                    if player.lifes <= 0:
+                        player.active = False
+                    self.is_flashing = True
+                    self.flash_start_time = current_time
+                cell_mines.pop(0).active = False
                     
             # Check laser collisions
-            for laser in self.lasers[:]:
-                if (laser.active and 
-                    laser.owner_id != player.id and 
-                    self.physics_engine.check_laser_collision(laser.position, player.position)):
+            for laser in laser_cells.get(cell, ()):
+                if laser.active and laser.owner_id != player.id:
                     if not player.shield_active:
                         player.lifes -= 1  # Lose 1 life when hit by laser
                         self.stats.record_life_lost(player.id)  # Record life lost
@@ -211,7 +257,7 @@ class GameState:
                         if player.lifes <= 0:
                             player.active = False
                         self.is_flashing = True
-                        self.flash_start_time = time.time()
+                        self.flash_start_time = current_time
                     laser.active = False
                     break
                     
@@ -224,7 +270,8 @@ class GameState:
         player.shield_active = True
         player.shield_available = False
         player.shield_used = True  # Mark shield as used
-        player.shield_start_time = time.time()
+        player.shield_start_time = time.monotonic()
+        self._state_version += 1
         return True
         
     def move_player(self, player_id: str) -> bool:
@@ -233,16 +280,18 @@ class GameState:
         if not player or not player.active:
             return False
             
-        # Calculate new position based on player's rotation
+        # Calculate new position based on player's rotation (both are integer grid vectors)
         direction = player.get_direction_vector()
-        new_position = Position(
-            int(player.position.x + direction.x),
-            int(player.position.y + direction.y)
-        )
+        new_x = player.position.x + direction.x
+        new_y = player.position.y + direction.y
             
-        # Check if move is valid
-        if self.physics_engine.is_valid_move(new_position, self.walls):
+        # Check if move is valid before creating the new position
+        if self.physics_engine.is_open_cell(new_x, new_y, self.walls_bitmap):
+            new_position = Position(new_x, new_y)
+            self._vacate_cell(player.position, player_id)
+            self._player_cells.setdefault(new_position, set()).add(player_id)
             player.position = new_position
+            self._state_version += 1
             return True
         return False
         
@@ -252,16 +301,9 @@ class GameState:
         if not player or not player.active:
             return False
             
-        # Calculate laser direction based on player's rotation
-        angle = math.radians(player.rotation)
-        direction = Position(
-            round(math.sin(angle)),  # Use sin for x to match game's coordinate system
-            -round(math.cos(angle))  # Negative cos for y because y increases downward
-        )
-        
-        # Create new laser
-        laser = Laser(player.position, direction, CELL_SIZE, player_id)
-        self.lasers.append(laser)
+        # Create new laser travelling in the player's facing direction
+        self.lasers.spawn(player.position, player.get_direction_vector(), CELL_SIZE, player_id)
+        self._state_version += 1
         return True
         
     def rotate_player(self, player_id: str, direction: str) -> bool:
@@ -277,6 +319,7 @@ class GameState:
         else:
             return False
             
+        self._state_version += 1
         return True
         
     def get_player_state(self) -> Dict:
@@ -295,38 +338,35 @@ class GameState:
 
     def get_environment_state(self) -> Dict:
         """Get the current state of the game environment."""
+        # Coordinate arrays for the mines (only rebuilt after they change) and lasers (move every tick).
+        # The game loop swaps in a new mine list and clears the cache while this runs,
+        # so read both once and only reuse an array built from the current list
+        mines = self.mines
+        cached = self._mines_np
+        if cached is None or cached[0] is not mines:
+            cached = (mines, np.array(
+                [(mine.position.x, mine.position.y) for mine in mines], dtype=np.int32
+            ).reshape(-1, 2))
+            self._mines_np = cached
+        mines_np = cached[1]
+        with self.lasers.lock:  # the game loop deactivates lasers while we gather them
+            lasers_np = self.lasers.pos[self.lasers.active]
+        
         # Get positions relative to each player and only within 5 block radius
         environment_states = {}
         for player_id, player in self.players.items():
-            walls_relative = []
-            mines_relative = []
-            lasers_relative = []
+            x, y = player.position
             
-            # Calculate relative positions for walls within radius
-            for wall in self.walls:
-                dx = wall.x - player.position.x
-                dy = wall.y - player.position.y
-                if abs(dx) <= 5 and abs(dy) <= 5:
-                    walls_relative.append([dx, dy])
-                    
-            # Calculate relative positions for mines within radius    
-            for mine in self.mines:
-                dx = mine.position.x - player.position.x
-                dy = mine.position.y - player.position.y
-                if abs(dx) <= 5 and abs(dy) <= 5:
-                    mines_relative.append([dx, dy])
-                    
-            # Calculate relative positions for lasers within radius
-            for laser in self.lasers:
-                dx = laser.position.x - player.position.x
-                dy = laser.position.y - player.position.y
-                if abs(dx) <= 5 and abs(dy) <= 5:
-                    lasers_relative.append([dx, dy])
-                    
+            # Walls never move, so their offsets only depend on the player's cell
+            walls_relative = self._walls_rel_cache.get((x, y))
+            if walls_relative is None:
+                walls_relative = _relative_within(self._walls_np, x, y)
+                self._walls_rel_cache[(x, y)] = walls_relative
+                
             environment_states[player_id] = {
                 'walls': walls_relative,
-                'mines': mines_relative, 
-                'lasers': lasers_relative,
+                'mines': _relative_within(mines_np, x, y), 
+                'lasers': _relative_within(lasers_np, x, y),
                 'game_over': self.game_over
             }
             
@@ -339,3 +379,43 @@ class GameState:
             **self.get_player_state(),
             **self.get_environment_state()
         }
+
+    def get_full_state(self) -> Dict:
+        """Get the player state and the per-player environment state."""
+        return {
+            'players': self.get_player_state()['players'],
+            'environment': self.get_environment_state()
+        }
+
+    def _cached_json_entry(self, name: str, build: Callable[[], Dict]) -> Tuple[bytes, str]:
+        """Serialize a state view as JSON, reusing it until the game state changes.
+        Returns the JSON and an ETag derived from its content."""
+        # Read the version before building, so an update that lands meanwhile invalidates the entry
+        version = self._state_version
+        cached = self._json_cache.get(name)
+        if cached is None or cached[0] != version:
+            content = orjson.dumps(build())
+            etag = '"' + hashlib.blake2b(content, digest_size=8).hexdigest() + '"'
+            cached = (version, content, etag)
+            self._json_cache[name] = cached
+        return cached[1], cached[2]
+
+    def _cached_json(self, name: str, build: Callable[[], Dict]) -> bytes:
+        """Serialize a state view as JSON, reusing it until the game state changes."""
+        return self._cached_json_entry(name, build)[0]
+
+    def cached_state_json(self) -> bytes:
+        """Get the complete game state serialized as JSON."""
+        return self._cached_json('state', self.get_state)
+
+    def cached_player_state_json(self) -> bytes:
+        """Get the player state serialized as JSON."""
+        return self._cached_json('player_state', self.get_player_state)
+
+    def cached_environment_state_json(self) -> Tuple[bytes, str]:
+        """Get the environment state serialized as JSON together with its ETag."""
+        return self._cached_json_entry('environment_state', self.get_environment_state)
+
+    def cached_full_state_json(self) -> Tuple[bytes, str]:
+        """Get the full state serialized as JSON together with its ETag."""
+        return self._cached_json_entry('full_state', self.get_full_state)
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Laser pool module storing all lasers as NumPy arrays.
+"""
+from collections import deque
+from threading import Lock
+from typing import Deque, Iterator, List, Optional, Tuple
+import numpy as np
+from physics_engine.position import Position
+from entities.laser import Laser
+from config.game_config import LASER_POOL_CAPACITY
+
+class LaserPool:
+    """Stores lasers structure-of-arrays style, one slot per laser, so they can be advanced together."""
+    
+    def __init__(self, capacity: int = LASER_POOL_CAPACITY):
+        """Initialize an empty pool with the given number of slots."""
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)  # x, y in grid coordinates
+        self.dir = np.zeros((capacity, 2), dtype=np.float64)  # direction vector
+        self.speed = np.zeros(capacity, dtype=np.float64)  # blocks per second
+        self.active = np.zeros(capacity, dtype=bool)  # slot holds a laser in flight
+        self._allocated = np.zeros(capacity, dtype=bool)  # slot handed out and not yet released
+        self.views: List[Optional[Laser]] = [None] * capacity  # Laser view per slot
+        self.free_slots: Deque[int] = deque(range(capacity))  # slots ready to be handed out
+        # Held while slots are handed out, released or written by the game loop,
+        # so a spawn from the API thread (which may grow the arrays) never interleaves with them
+        self.lock = Lock()
+        
+    def _grow(self):
+        """Double the number of slots."""
+        capacity = len(self.active)
+        self.pos = np.concatenate([self.pos, np.zeros((capacity, 2), dtype=np.float64)])
+        self.dir = np.concatenate([self.dir, np.zeros((capacity, 2), dtype=np.float64)])
+        self.speed = np.concatenate([self.speed, np.zeros(capacity, dtype=np.float64)])
+        self.active = np.concatenate([self.active, np.zeros(capacity, dtype=bool)])
+        self._allocated = np.concatenate([self._allocated, np.zeros(capacity, dtype=bool)])
+        self.views.extend([None] * capacity)
+        self.free_slots.extend(range(capacity, 2 * capacity))
+        
+    def spawn(self, position: Position, direction: Position, cell_size: int, owner_id: str) -> Laser:
+        """Put a new laser into a free slot and return its view."""
+        with self.lock:
+            if not self.free_slots:
+                self._grow()
+            slot = self.free_slots.popleft()
+            
+            laser = Laser(self, slot, direction, cell_size, owner_id)
+            self.views[slot] = laser
+            self.pos[slot] = (position.x, position.y)
+            self.dir[slot] = (direction.x, direction.y)
+            self.speed[slot] = laser.speed
+            self._allocated[slot] = True
+            # Mark the slot active last, so readers never see a half-filled laser
+            self.active[slot] = True
+            return laser
+        
+    def release_inactive(self):
+        """Return the slots of lasers that have stopped to the free list.
+        The caller must hold `lock`."""
+        released = np.flatnonzero(self._allocated & ~self.active)
+        self._allocated[released] = False
+        for slot in released.tolist():
+            self.views[slot] = None
+        self.free_slots.extend(released.tolist())
+            
+    def active_slots(self) -> np.ndarray:
+        """Indices of the slots holding lasers in flight."""
+        return np.flatnonzero(self.active)
+        
+    def cells(self, slots: np.ndarray) -> List[Tuple[int, int]]:
+        """Grid cells occupied by the lasers in the given slots."""
+        return [tuple(cell) for cell in self.pos[slots].astype(np.intp).tolist()]
+        
+    def __iter__(self) -> Iterator[Laser]:
+        """Iterate over the lasers in flight."""
+        for slot in self.active_slots().tolist():
+            yield self.views[slot]
+            
+    def __len__(self) -> int:
+        """Number of lasers in flight."""
+        return int(np.count_nonzero(self.active))
\ No newline at end of file
@@ -1,65 +1,61 @@
 """
 Physics module for handling collision detection and movement validation.
 """
-from typing import List, Tuple
-from physics_engine.position import Position
-from entities.laser import Laser
-from entities.mine import Mine
+from typing import Sequence
+import numpy as np
+from physics_engine.laser_pool import LaserPool
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, update_lasers falls back to NumPy
+    njit = None
+
+def _step_lasers(pos: np.ndarray, direction: np.ndarray, speed: np.ndarray, active: np.ndarray,
+                 wall_mask: np.ndarray, grid_w: int, grid_h: int, dt: float):
+    """Advance the active lasers in place, deactivating those that leave the world or hit a wall."""
+    for i in range(active.shape[0]):
+        if not active[i]:
+            continue
+        x = pos[i, 0] + direction[i, 0] * dt * speed[i]
+        y = pos[i, 1] + direction[i, 1] * dt * speed[i]
+        pos[i, 0] = x
+        pos[i, 1] = y
+        if not (0 <= x < grid_w and 0 <= y < grid_h) or wall_mask[int(x), int(y)]:
+            active[i] = False
+
+# Compiled laser kernel, or None when numba is not installed
+step_lasers = njit(cache=True)(_step_lasers) if njit is not None else None
 
 class PhysicsEngine:
     def __init__(self, world_width: int, world_height: int, cell_size: int):
         self.world_width = world_width
         self.world_height = world_height
         self.cell_size = cell_size
+        # World size in grid cells
+        self._grid_w = world_width // cell_size
+        self._grid_h = world_height // cell_size
 
-    def check_wall_collision(self, position: Position, walls: List[Position]) -> bool:
-        """Check if a position collides with any wall."""
-        # Convert to grid coordinates
-        grid_x = int(position.x)
-        grid_y = int(position.y)
-        return Position(grid_x, grid_y) in walls
-
-    def check_mine_collision(self, position: Position, mine_position: Position) -> bool:
-        """Check if a position collides with a mine."""
-        # Convert to grid coordinates
-        grid_x = int(position.x)
-        grid_y = int(position.y)
-        mine_grid_x = int(mine_position.x)
-        mine_grid_y = int(mine_position.y)
-        return grid_x == mine_grid_x and grid_y == mine_grid_y
+    def is_open_cell(self, x: int, y: int, walls: Sequence[int]) -> bool:
+        """Check if integer grid coordinates are inside the world and not a wall.
+        Walls are given as a bitmap with one byte per cell, indexed by y * grid_width + x."""
+        grid_w = self._grid_w
+        return 0 <= x < grid_w and 0 <= y < self._grid_h and walls[y * grid_w + x] == 0
 
-    def check_laser_collision(self, laser_position: Position, target_position: Position) -> bool:
-        """Check if a laser position collides with a target position."""
-        # Convert to grid coordinates
-        laser_grid_x = int(laser_position.x)
-        laser_grid_y = int(laser_position.y)
-        target_grid_x = int(target_position.x)
-        target_grid_y = int(target_position.y)
-        return laser_grid_x == target_grid_x and laser_grid_y == target_grid_y
-
-    def is_valid_move(self, position: Position, walls: List[Position]) -> bool:
-        """Check if a move to the given position is valid."""
-        # Check wall collision
-        if self.check_wall_collision(position, walls):
-            return False
-            
-        # Check world boundaries (in grid coordinates)
-        grid_width = self.world_width // self.cell_size
-        grid_height = self.world_height // self.cell_size
-        if (position.x < 0 or position.x >= grid_width or 
-            position.y < 0 or position.y >= grid_height):
-            return False
+    def update_lasers(self, lasers: LaserPool, dt: float, wall_mask: np.ndarray):
+        """Advance all lasers in one vectorized step.
+        Lasers leaving the world or entering a wall cell (wall_mask indexed [x, y]) are deactivated."""
+        if step_lasers is not None:
+            step_lasers(lasers.pos, lasers.dir, lasers.speed, lasers.active,
+                        wall_mask, self._grid_w, self._grid_h, dt)
+            return
             
-        return True
-
-    def update_laser_position(self, laser: Laser, dt: float) -> bool:
-        """Update laser position and check if it's still valid."""
-        # Move laser
-        laser.position.x += laser.direction.x * dt * laser.speed
-        laser.position.y += laser.direction.y * dt * laser.speed
+        slots = lasers.active_slots()
+        pos = lasers.pos[slots] + lasers.dir[slots] * dt * lasers.speed[slots, None]
+        lasers.pos[slots] = pos
         
-        # Check if laser is still in bounds (using grid coordinates)
-        grid_width = self.world_width // self.cell_size
-        grid_height = self.world_height // self.cell_size
-        return (0 <= laser.position.x < grid_width and 
-                0 <= laser.position.y < grid_height) 
\ No newline at end of file
+        # Check bounds first so that only in-world cells are looked up in the wall mask
+        alive = ((pos[:, 0] >= 0) & (pos[:, 0] < self._grid_w) &
+                 (pos[:, 1] >= 0) & (pos[:, 1] < self._grid_h))
+        cells = pos[alive].astype(np.intp)
+        alive[alive] = ~wall_mask[cells[:, 0], cells[:, 1]]
+        lasers.active[slots] = alive
\ No newline at end of file
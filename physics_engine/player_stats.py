@@ -8,6 +8,10 @@ import csv
 import os
 from datetime import datetime
 
+STATS_DIR = "game_stats"
+STATS_FIELDNAMES = ['player_id', 'seconds_survived', 'laser_hits', 'lives_lost', 'is_last_surviving']
+_stats_dir_ready = False  # Set once STATS_DIR is known to exist
+
 @dataclass
 class PlayerStats:
     """Class to track player statistics."""
@@ -17,9 +21,9 @@ class PlayerStats:
     lives_lost: int = 0
     is_last_surviving: bool = False
     
-    def update_survival_time(self):
+    def update_survival_time(self, current_time: float):
         """Update the survival time if the player is still active."""
-        self.seconds_survived = time.time() - self.start_time
+        self.seconds_survived = current_time - self.start_time
         
     def record_laser_hit(self):
         """Record a successful laser hit on another player."""
@@ -38,18 +42,18 @@ class GameStats:
         
     def add_player(self, player_id: str):
         """Add a new player to statistics tracking."""
-        self.player_stats[player_id] = PlayerStats(start_time=time.time())
+        self.player_stats[player_id] = PlayerStats(start_time=time.monotonic())
         
     def remove_player(self, player_id: str):
         """Remove a player from statistics tracking."""
         if player_id in self.player_stats:
             del self.player_stats[player_id]
             
-    def update_stats(self, player_id: str, is_active: bool):
-        """Update statistics for a player."""
+    def update_stats(self, player_id: str, is_active: bool, current_time: float):
+        """Update statistics for a player at the given time."""
         if player_id in self.player_stats:
             if is_active:
-                self.player_stats[player_id].update_survival_time()
+                self.player_stats[player_id].update_survival_time(current_time)
                 
     def record_laser_hit(self, player_id: str):
         """Record a laser hit for a player."""
@@ -68,24 +72,26 @@ class GameStats:
             
     def export_stats(self):
         """Export game statistics to a CSV file."""
-        # Create game_stats directory if it doesn't exist
-        os.makedirs("game_stats", exist_ok=True)
+        global _stats_dir_ready
+        
+        # Create game_stats directory if it doesn't exist (checked once per process)
+        if not _stats_dir_ready:
+            os.makedirs(STATS_DIR, exist_ok=True)
+            _stats_dir_ready = True
         
         # Generate filename with current timestamp
         timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
-        filename = f"game_stats/{timestamp}_gamestats.csv"
+        filename = f"{STATS_DIR}/{timestamp}_gamestats.csv"
+        
+        # Build all rows up front, in STATS_FIELDNAMES order
+        rows = [
+            [player_id, round(stats.seconds_survived, 2), stats.laser_hits,
+             stats.lives_lost, stats.is_last_surviving]
+            for player_id, stats in self.player_stats.items()
+        ]
         
         # Write statistics to CSV file
         with open(filename, 'w', newline='') as csvfile:
-            fieldnames = ['player_id', 'seconds_survived', 'laser_hits', 'lives_lost', 'is_last_surviving']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for player_id, stats in self.player_stats.items():
-                writer.writerow({
-                    'player_id': player_id,
-                    'seconds_survived': round(stats.seconds_survived, 2),
-                    'laser_hits': stats.laser_hits,
-                    'lives_lost': stats.lives_lost,
-                    'is_last_surviving': stats.is_last_surviving
-                }) 
\ No newline at end of file
+            writer = csv.writer(csvfile)
+            writer.writerow(STATS_FIELDNAMES)
+            writer.writerows(rows) 
\ No newline at end of file
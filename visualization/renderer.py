@@ -41,6 +41,12 @@ class GameRenderer:
         self.spaceship_image = pygame.image.load("assets/spaceship.png")
         self.spaceship_image = pygame.transform.scale(self.spaceship_image, (CELL_SIZE, CELL_SIZE))
         
+        # Pre-rotate the spaceship for the 4 possible rotations
+        self._spaceship_rot = {
+            rotation: pygame.transform.rotate(self.spaceship_image, -rotation)
+            for rotation in (0, 90, 180, 270)
+        }
+        
         # Load and scale rock image for walls
         self.rock_image = pygame.image.load("assets/rock.png")
         self.rock_image = pygame.transform.scale(self.rock_image, (CELL_SIZE, CELL_SIZE))
@@ -48,17 +54,30 @@ class GameRenderer:
         # Initialize fonts
         pygame.font.init()
         self.font = pygame.font.SysFont('Arial', 24)
+        self._text_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}  # (text, color) -> rendered text
         
         # Track player colors
         self.player_colors = {}
+        
+        # Pre-drawn translucent overlays, reused every frame
+        self._player_circle_surfs: Dict[Tuple[int, int, int], pygame.Surface] = {
+            color: self._build_circle_surface(color, int(CELL_SIZE * PLAYER_CIRCLE_RADIUS_FACTOR))
+            for color in PLAYER_COLORS + [WHITE]
+        }
+        self._shield_surf = self._build_circle_surface(BLUE, int(SHIELD_RADIUS_FACTOR * CELL_SIZE))
+        self._flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._flash_surf.fill((*RED, 128))  # Red with 50% transparency
+        
+        # Walls never move, so draw them onto the background once
+        self._static_layer = self._build_static_layer()
 
     def render(self):
         """Render the current game state."""
-        # Draw background
-        self.screen.blit(self.background, (0, 0))
+        # Draw background with the score area and walls already on it
+        self.screen.blit(self._static_layer, (0, 0))
 
-        # Draw walls
-        self._render_walls()
+        # Keep the game world out of the score area (first row)
+        self.screen.set_clip((0, CELL_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT - CELL_SIZE))
 
         # Draw mines
         self._render_mines()
@@ -74,27 +93,38 @@ class GameRenderer:
             self._render_flash()
 
         # Draw UI
+        self.screen.set_clip(None)
         self._render_ui()
 
         # Update display
         pygame.display.flip()
 
-    def _render_walls(self):
-        """Render the walls."""
-        # First render a black background for the score area (first row)
-        pygame.draw.rect(
-            self.screen,
-            BLACK,
-            (0, 0, SCREEN_WIDTH, CELL_SIZE)
-        )
+    def _build_static_layer(self) -> pygame.Surface:
+        """Pre-render the background, score area and walls into one surface."""
+        layer = self.background.convert()
         
-        # Then render the walls
+        # First render the walls
         for wall in self.game_state.walls:
             # Draw rock image centered in the cell
-            self.screen.blit(
+            layer.blit(
                 self.rock_image,
                 (wall.x * CELL_SIZE, wall.y * CELL_SIZE)
             )
+            
+        # Then render a black background for the score area (first row) on top
+        pygame.draw.rect(
+            layer,
+            BLACK,
+            (0, 0, SCREEN_WIDTH, CELL_SIZE)
+        )
+        return layer
+
+    @staticmethod
+    def _build_circle_surface(color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+        """Draw a semi-transparent circle on its own surface."""
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, TRANSPARENCY_ALPHA), (radius, radius), radius)
+        return surface
 
     def _render_mines(self):
         """Render the mines."""
@@ -108,19 +138,21 @@ class GameRenderer:
 
     def _render_lasers(self):
         """Render the lasers."""
-        for laser in self.game_state.lasers:
-            if laser.active:
-                # Draw laser with owner's color
-                color = self.player_colors.get(laser.owner_id, WHITE)
-                pygame.draw.line(
-                    self.screen,
-                    color,
-                    (laser.position.x * CELL_SIZE + CELL_SIZE // 2,
-                     laser.position.y * CELL_SIZE + CELL_SIZE // 2),
-                    ((laser.position.x + laser.direction.x) * CELL_SIZE + CELL_SIZE // 2,
-                     (laser.position.y + laser.direction.y) * CELL_SIZE + CELL_SIZE // 2),
-                    2
-                )
+        lasers = self.game_state.lasers
+        slots = lasers.active_slots()
+        if len(slots) == 0:
+            return
+            
+        # Compute every laser's start and end point (cell centers) in one pass over the pool
+        pos = lasers.pos[slots]
+        starts = (pos * CELL_SIZE + CELL_SIZE // 2).tolist()
+        ends = ((pos + lasers.dir[slots]) * CELL_SIZE + CELL_SIZE // 2).tolist()
+        
+        # Draw each laser with its owner's color
+        draw_line = pygame.draw.line
+        for slot, start, end in zip(slots.tolist(), starts, ends):
+            color = self.player_colors.get(lasers.views[slot].owner_id, WHITE)
+            draw_line(self.screen, color, start, end, 2)
 
     def _render_players(self):
         """Render all players and their shields."""
@@ -138,41 +170,40 @@ class GameRenderer:
             
             # Draw colored circle for player identification
             color = self.player_colors.get(player_id, WHITE)
-            circle_radius = int(CELL_SIZE * PLAYER_CIRCLE_RADIUS_FACTOR)
-            circle_surface = pygame.Surface((circle_radius * 2, circle_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(circle_surface, (*color, TRANSPARENCY_ALPHA), (circle_radius, circle_radius), circle_radius)
+            circle_surface = self._player_circle_surfs[color]
+            circle_radius = circle_surface.get_width() // 2
             self.screen.blit(circle_surface, (x - circle_radius, y - circle_radius))
             
             # Draw shield if active
             if player.shield_active:
-                shield_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                shield_radius = int(SHIELD_RADIUS_FACTOR * CELL_SIZE)
-                pygame.draw.circle(
-                    shield_surface,
-                    (*BLUE, TRANSPARENCY_ALPHA),
-                    (x, y),
-                    shield_radius
-                )
-                self.screen.blit(shield_surface, (0, 0))
+                shield_radius = self._shield_surf.get_width() // 2
+                self.screen.blit(self._shield_surf, (x - shield_radius, y - shield_radius))
             
-            # Draw spaceship image
-            rotated_image = pygame.transform.rotate(self.spaceship_image, -player.rotation)
+            # Draw the pre-rotated spaceship image
+            rotated_image = self._spaceship_rot[player.rotation]
             rect = rotated_image.get_rect(center=(x, y))
             self.screen.blit(rotated_image, rect)
 
     def _render_flash(self):
         """Render the flash effect."""
-        # Create a semi-transparent red overlay
-        flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        flash_surface.fill((*RED, 128))  # Red with 50% transparency
-        self.screen.blit(flash_surface, (0, 0))
+        # Blit the pre-filled semi-transparent red overlay
+        self.screen.blit(self._flash_surf, (0, 0))
+
+    def _render_text(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text with the UI font, reusing the surface while the text and color stay the same."""
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
 
     def _get_remaining_time(self) -> str:
         """Calculate and format the remaining game time."""
         if self.game_state.game_start_time is None:
             return "2:00"
             
-        elapsed_time = time.time() - self.game_state.game_start_time
+        elapsed_time = time.monotonic() - self.game_state.game_start_time
         remaining_time = max(0, self.game_state.GAME_TIME_LIMIT - elapsed_time)
         minutes = int(remaining_time // 60)
         seconds = int(remaining_time % 60)
@@ -180,20 +211,15 @@ class GameRenderer:
 
     def _render_ui(self):
         """Render the UI elements."""
-        # Draw black background for score area
-        pygame.draw.rect(
-            self.screen,
-            BLACK,
-            (0, 0, SCREEN_WIDTH, CELL_SIZE)
-        )
+        # The black score area background is part of the static layer
         
         # Calculate total width needed for all player info
         total_width = 0
         player_info = []
         for player_id, player in self.game_state.players.items():
             color = self.player_colors.get(player_id, WHITE)
-            name_text = self.font.render(player.name, True, color)
-            lifes_text = self.font.render(f"Lifes: {player.lifes}", True, color)
+            name_text = self._render_text(player.name, color)
+            lifes_text = self._render_text(f"Lifes: {player.lifes}", color)
             width = UI_CIRCLE_RADIUS * 2 + name_text.get_width() + lifes_text.get_width() + 20
             player_info.append((player_id, player, color, name_text, lifes_text, width))
             total_width += width
@@ -217,12 +243,12 @@ class GameRenderer:
             x_offset += width
             
         # Draw time counter in top right corner
-        time_text = self.font.render(self._get_remaining_time(), True, WHITE)
+        time_text = self._render_text(self._get_remaining_time(), WHITE)
         time_x = SCREEN_WIDTH - time_text.get_width() - 20  # 20 pixels padding from right edge
         self.screen.blit(time_text, (time_x, 5))
 
         # Draw game over message
         if self.game_state.game_over:
-            text = self.font.render("Game Over!", True, WHITE)
+            text = self._render_text("Game Over!", WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             self.screen.blit(text, text_rect) 
\ No newline at end of file